@@ -0,0 +1,280 @@
+"""Parallel historical backfill of UCSD police PDFs.
+
+Splits the report dropdown into month-long partitions and crawls them in
+separate worker processes, each with its own Chrome session and HTTP session.
+Workers also parse their PDFs and stream each finished report back through a
+queue, so the main process merges reports into police_reports.json as they
+arrive rather than per partition. A partition is checkpointed in the manifest
+once all of its files are in; re-running only fetches files its manifest entry
+does not list yet, so the current month picks up reports published after it
+was first checkpointed.
+
+Usage: python backfill.py [--workers 4]
+"""
+import os
+import json
+import time
+import argparse
+from datetime import datetime, timezone
+from collections import defaultdict
+from queue import Empty
+from multiprocessing import Manager
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
+
+from pdf_reader import read_pdf_report, get_supabase_client, seed_upvotes
+from scraper import BASE_URL, create_driver, option_filename, find_pdf_url
+
+MANIFEST_NAME = "backfill_manifest.json"
+UNDATED_PARTITION = "undated"
+
+# Per worker process, set up once by init_worker and reused across partitions
+_driver = None
+_session = None
+_queue = None
+
+
+def list_options():
+    """Return the report names in the dropdown, in page order."""
+    driver = create_driver()
+    try:
+        driver.get(BASE_URL)
+        time.sleep(2)
+        select = Select(driver.find_element(By.TAG_NAME, "select"))
+        texts = [option.text.strip() for option in select.options]
+        return [text for text in texts if text and "Select" not in text]
+    finally:
+        driver.quit()
+
+
+def partition_key(text):
+    """Map a dropdown entry such as "January 5, 2025" to its "2025-01" partition."""
+    name = text[:-len(".pdf")] if text.endswith(".pdf") else text
+    try:
+        # Same leading "Month DD, YYYY" format sync_supabase sorts reports by
+        date = datetime.strptime(" ".join(name.split()[:3]), "%B %d, %Y")
+    except ValueError:
+        return UNDATED_PARTITION
+    return date.strftime("%Y-%m")
+
+
+def partition_options(options):
+    partitions = defaultdict(list)
+    for text in options:
+        partitions[partition_key(text)].append(text)
+    # Newest first, so a partial run recovers the most relevant data first
+    return dict(sorted(partitions.items(), reverse=True))
+
+
+def load_json(path, default):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return default
+
+
+def save_json(path, data):
+    # Write then rename so an interrupted run never leaves a truncated file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def quit_driver():
+    try:
+        _driver.quit()
+    except Exception:
+        pass
+
+
+def driver_alive():
+    try:
+        _driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def init_worker(queue):
+    """Start the Chrome and HTTP sessions a worker process keeps for its whole life."""
+    global _driver, _session, _queue
+    _queue = queue
+    _driver = create_driver()
+    _session = requests.Session()
+    # atexit does not run in pool workers; multiprocessing finalizers do
+    Finalize(None, quit_driver, exitpriority=10)
+    Finalize(None, _session.close, exitpriority=10)
+
+
+def restart_driver():
+    """Replace a crashed or expired Chrome session so the rest of the worker's queue still runs."""
+    global _driver
+    quit_driver()
+    _driver = create_driver()
+
+
+def download_pdf(url, filepath):
+    # Download next to the target and rename, so a killed worker never leaves a partial PDF behind
+    response = _session.get(url, timeout=30)
+    response.raise_for_status()
+    tmp_path = f"{filepath}.part"
+    with open(tmp_path, 'wb') as f:
+        f.write(response.content)
+    os.replace(tmp_path, filepath)
+
+
+def fetch_pdf(text, filepath):
+    # Reload the page for every file, so a PDF left open by the previous one never hides the dropdown
+    _driver.get(BASE_URL)
+    WebDriverWait(_driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "select")))
+    select = Select(_driver.find_element(By.TAG_NAME, "select"))
+    select.select_by_visible_text(text)
+    time.sleep(1)
+
+    pdf_url = find_pdf_url(_driver)
+    if not pdf_url:
+        return False
+
+    download_pdf(pdf_url, filepath)
+    return True
+
+
+def backfill_partition(key, texts, output_dir, processed):
+    """Download and parse one partition, streaming each report to the main process. Runs in a worker."""
+    failed = []
+
+    for text in texts:
+        filename = option_filename(text)
+        filepath = os.path.join(output_dir, filename)
+
+        try:
+            if not os.path.exists(filepath) and not fetch_pdf(text, filepath):
+                print(f"[{key}] FAIL {filename}: no PDF link")
+                failed.append(filename)
+                continue
+
+            if filename not in processed:
+                report, incidents = read_pdf_report(filepath)
+                _queue.put((key, report, incidents))
+
+        except WebDriverException as e:
+            print(f"[{key}] ERROR {filename}: {e}")
+            failed.append(filename)
+            if not driver_alive():
+                print(f"[{key}] Browser session lost, restarting Chrome")
+                restart_driver()
+
+        except Exception as e:
+            print(f"[{key}] ERROR {filename}: {e}")
+            failed.append(filename)
+
+    return failed
+
+
+def drain_reports(queue, data, processed, supabase, counts):
+    """Merge every report the workers have streamed so far. Returns how many were new."""
+    added = 0
+    while True:
+        try:
+            key, report, incidents = queue.get_nowait()
+        except Empty:
+            return added
+
+        if report["filename"] in processed:
+            continue
+
+        data["reports"].append(report)
+        data["processed_files"].append(report["filename"])
+        processed.add(report["filename"])
+        seed_upvotes(supabase, incidents)
+        counts[key] += 1
+        added += 1
+        print(f"READ {report['filename']} ({report['incident_count']} incidents)")
+
+
+def run_backfill(workers=4, pdf_dir="ucsd_police_reports", output_file="app/public/police_reports.json"):
+    os.makedirs(pdf_dir, exist_ok=True)
+    manifest_path = os.path.join(pdf_dir, MANIFEST_NAME)
+    manifest = load_json(manifest_path, {"partitions": {}})
+
+    data = load_json(output_file, {"reports": [], "processed_files": []})
+    processed = set(data.get("processed_files", []))
+
+    partitions = partition_options(list_options())
+    pending = {}
+    for key, texts in partitions.items():
+        done = set(manifest["partitions"].get(key, {}).get("files", []))
+        missing = [text for text in texts if option_filename(text) not in done]
+        if missing:
+            pending[key] = missing
+    print(f"{len(partitions)} partitions, {len(partitions) - len(pending)} complete, {len(pending)} to run on {workers} workers")
+
+    supabase = get_supabase_client()
+    stats = {"partitions": 0, "reports": 0, "failed": []}
+    counts = defaultdict(int)
+
+    with Manager() as manager:
+        queue = manager.Queue()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(queue,)) as executor:
+            futures = {
+                executor.submit(backfill_partition, key, texts, pdf_dir, processed): key
+                for key, texts in pending.items()
+            }
+            remaining = set(futures)
+
+            while remaining:
+                finished, remaining = wait(remaining, timeout=1, return_when=FIRST_COMPLETED)
+
+                # Workers put each report before returning, so a finished partition's reports are all queued by now
+                added = drain_reports(queue, data, processed, supabase, counts)
+                if added:
+                    save_json(output_file, data)
+                    stats["reports"] += added
+
+                for future in finished:
+                    key = futures[future]
+                    try:
+                        failed = future.result()
+                    except Exception as e:
+                        stats["failed"].append(key)
+                        print(f"FAIL {key}: {e}")
+                        continue
+
+                    # Partitions with failures stay pending so the next run retries them
+                    if failed:
+                        stats["failed"].append(key)
+                        print(f"PART {key}: {counts[key]} new reports, {len(failed)} failed: {', '.join(failed)}")
+                        continue
+
+                    done = manifest["partitions"].get(key, {}).get("files", [])
+                    manifest["partitions"][key] = {
+                        "files": done + [option_filename(text) for text in pending[key]],
+                        "completed_at": datetime.now(timezone.utc).isoformat()
+                    }
+                    save_json(manifest_path, manifest)
+                    stats["partitions"] += 1
+                    print(f"DONE {key}: {counts[key]} new reports")
+
+    print(f"\nCompleted: {stats['partitions']} partitions, {stats['reports']} new reports, {len(stats['failed'])} partitions failed")
+    if stats["failed"]:
+        print(f"Failed partitions: {', '.join(sorted(stats['failed'], reverse=True))}")
+    print(f"Output: {os.path.abspath(output_file)}")
+    print(f"Manifest: {os.path.abspath(manifest_path)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill historical UCSD police PDFs in parallel")
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes (default: 4)")
+    parser.add_argument("--pdf-dir", default="ucsd_police_reports")
+    parser.add_argument("--output", default="app/public/police_reports.json")
+    args = parser.parse_args()
+
+    run_backfill(args.workers, args.pdf_dir, args.output)
@@ -0,0 +1,104 @@
+"""Compare plain incident dicts against Incident objects at archive scale.
+
+Usage: python bench_incident.py [incident_count]
+"""
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from incident import Incident
+
+CATEGORIES = [
+    'Theft', 'Vandalism', 'Welfare Check', 'Noise Disturbance', 'Suspicious Person',
+    'Petty Theft', 'Burglary', 'Traffic Collision', 'Medical Aid', 'Fire Alarm',
+]
+LOCATIONS = [
+    'Geisel Library', 'Price Center', 'Warren College', 'Revelle College',
+    'Muir College', 'Sixth College', 'Marshall College', 'RIMAC', 'Gilman Parking Structure',
+]
+DISPOSITIONS = ['Report Taken', 'Checks OK', 'Information Only', 'Gone on Arrival', 'Cleared']
+
+
+def build_archive_json(count):
+    rng = random.Random(42)
+    incidents = []
+    for n in range(count):
+        month, day = rng.randint(1, 12), rng.randint(1, 28)
+        hour, minute = rng.randint(1, 12), rng.randint(0, 59)
+        incidents.append({
+            'category': rng.choice(CATEGORIES),
+            'location': rng.choice(LOCATIONS),
+            'date_reported': f"{month}/{day}/2024",
+            'incident_case': f"2024{n:06d}",
+            'date_occurred': f"{month}/{day}/2024",
+            'time_occurred': f"{hour}:{minute:02d} {rng.choice(['AM', 'PM'])}",
+            'summary': 'Reporting party states property was taken from an unsecured area.',
+            'disposition': rng.choice(DISPOSITIONS),
+        })
+    return json.dumps(incidents)
+
+
+def measure(label, loader):
+    # Time without tracemalloc, since tracing slows allocation-heavy code a lot
+    gc.collect()
+    start = time.perf_counter()
+    loader()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = loader()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {current / 1024 / 1024:8.1f} MiB  {elapsed:7.3f} s")
+    return result
+
+
+def dict_minutes(incidents):
+    # What downstream code has to do with the plain dict shape
+    total = 0
+    for incident in incidents:
+        occurred = datetime.strptime(incident['date_occurred'], '%m/%d/%Y')
+        clock = datetime.strptime(incident['time_occurred'], '%I:%M %p')
+        total += occurred.weekday() + clock.hour * 60 + clock.minute
+    return total
+
+
+def incident_minutes(incidents):
+    total = 0
+    for incident in incidents:
+        total += incident.occurred_on.weekday() + incident.minute_of_day
+    return total
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    raw = build_archive_json(count)
+    print(f"{count} incidents, {len(raw) / 1024 / 1024:.1f} MiB of JSON\n")
+
+    dicts = measure('load as dicts', lambda: json.loads(raw))
+    incidents = measure('load as Incident', lambda: [Incident.from_dict(d) for d in json.loads(raw)])
+
+    start = time.perf_counter()
+    dict_total = dict_minutes(dicts)
+    dict_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    incident_total = incident_minutes(incidents)
+    incident_elapsed = time.perf_counter() - start
+
+    assert dict_total == incident_total
+    print(f"\ndate/time access, dicts      {dict_elapsed:7.3f} s (strptime)")
+    print(f"date/time access, Incident   {incident_elapsed:7.3f} s (pre-parsed)")
+
+    start = time.perf_counter()
+    json.dumps([incident.to_dict() for incident in incidents])
+    print(f"serialize Incident to JSON   {time.perf_counter() - start:7.3f} s")
+
+
+if __name__ == '__main__':
+    main()
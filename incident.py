@@ -0,0 +1,107 @@
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+# Key order used when writing incidents back to police_reports.json
+INCIDENT_FIELDS = (
+    'category',
+    'location',
+    'date_reported',
+    'incident_case',
+    'date_occurred',
+    'time_occurred',
+    'summary',
+    'disposition',
+)
+
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*([AaPp][Mm])?')
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> Optional[date]:
+    """Parse an MM/DD/YYYY string, returning None if it is empty or malformed."""
+    try:
+        month, day, year = date_str.split('/')
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def parse_minute_of_day(time_str: str) -> Optional[int]:
+    """Return minutes since midnight for the first time in the string (e.g. "9:05 PM" -> 1265)."""
+    match = TIME_PATTERN.search(time_str)
+    if not match:
+        return None
+
+    hours = int(match.group(1))
+    minutes = int(match.group(2))
+    period = match.group(3)
+
+    if period:
+        if not 1 <= hours <= 12:
+            return None
+        hours %= 12
+        if period.upper() == 'PM':
+            hours += 12
+
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+@dataclass(slots=True, frozen=True)
+class Incident:
+    """A single crime log entry, as stored in police_reports.json.
+
+    Every text field is a string: missing or null values (e.g. a null column
+    in a Supabase row) are stored and written back as ''. Instances are frozen
+    so the derived date fields can never drift from the strings they came from;
+    use dataclasses.replace() to change a field.
+    """
+
+    category: str = ''
+    location: str = ''
+    date_reported: str = ''
+    incident_case: str = ''
+    date_occurred: str = ''
+    time_occurred: str = ''
+    summary: str = ''
+    disposition: str = ''
+
+    # Derived on construction, never serialized
+    reported_on: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    occurred_on: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    minute_of_day: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so fields have to be set through object.__setattr__
+        set_field = object.__setattr__
+
+        for name in INCIDENT_FIELDS:
+            if getattr(self, name) is None:
+                set_field(self, name, '')
+
+        # These repeat across thousands of incidents, so share one string object each
+        set_field(self, 'category', sys.intern(self.category))
+        set_field(self, 'location', sys.intern(self.location))
+        set_field(self, 'disposition', sys.intern(self.disposition))
+
+        set_field(self, 'reported_on', parse_date(self.date_reported))
+        set_field(self, 'occurred_on', parse_date(self.date_occurred))
+        set_field(self, 'minute_of_day', parse_minute_of_day(self.time_occurred))
+
+    def __reduce__(self):
+        # Rebuild through __init__ when unpickled (e.g. from a backfill worker), so strings are
+        # interned in the receiving process and derived fields are not sent over the pipe
+        return (self.__class__, tuple(getattr(self, name) for name in INCIDENT_FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Incident':
+        return cls(**{name: data.get(name) for name in INCIDENT_FIELDS})
+
+    def to_dict(self) -> Dict[str, str]:
+        return {name: getattr(self, name) for name in INCIDENT_FIELDS}
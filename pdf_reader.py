@@ -4,6 +4,7 @@ import re
 import random
 from pathlib import Path
 import pdfplumber
+from incident import Incident
 
 def parse_pdf_content(text):
     incidents = []
@@ -102,14 +103,8 @@ def parse_pdf_content(text):
             
             i += 1
         
-        # Set defaults for missing fields
-        incident.setdefault('incident_case', '')
-        incident.setdefault('date_occurred', '')
-        incident.setdefault('time_occurred', '')
-        incident.setdefault('summary', '')
-        incident.setdefault('disposition', '')
-        
-        incidents.append(incident)
+        # Missing fields default to empty strings
+        incidents.append(Incident.from_dict(incident))
     
     return incidents
 
@@ -131,7 +126,7 @@ def seed_upvotes(client, incidents):
     if not client:
         return
     for incident in incidents:
-        case = incident.get('incident_case', '').strip()
+        case = incident.incident_case.strip()
         if not case:
             continue
         try:
@@ -150,6 +145,27 @@ def seed_upvotes(client, incidents):
             print(f"  Failed to seed upvotes for {case}: {e}")
 
 
+def read_pdf_report(pdf_file):
+    """Extract one PDF into a police_reports.json report entry, plus its Incident objects."""
+    pdf_file = Path(pdf_file)
+    with pdfplumber.open(pdf_file) as pdf:
+        text = ""
+        for page in pdf.pages:
+            text += page.extract_text() + "\n"
+        page_count = len(pdf.pages)
+    
+    incidents = parse_pdf_content(text)
+    
+    report = {
+        "filename": pdf_file.name,
+        "date": pdf_file.name.replace(".pdf", ""),
+        "page_count": page_count,
+        "incident_count": len(incidents),
+        "incidents": [incident.to_dict() for incident in incidents]
+    }
+    return report, incidents
+
+
 def parse_pdfs_to_json(pdf_dir="ucsd_police_reports", output_file="app/public/police_reports.json"):
     pdf_path = Path(pdf_dir)
     
@@ -179,20 +195,7 @@ def parse_pdfs_to_json(pdf_dir="ucsd_police_reports", output_file="app/public/po
             continue
         
         try:
-            with pdfplumber.open(pdf_file) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
-            
-            incidents = parse_pdf_content(text)
-            
-            report = {
-                "filename": filename,
-                "date": filename.replace(".pdf", ""),
-                "page_count": len(pdf.pages),
-                "incident_count": len(incidents),
-                "incidents": incidents
-            }
+            report, incidents = read_pdf_report(pdf_file)
             
             data["reports"].append(report)
             data["processed_files"].append(filename)
@@ -8,20 +8,33 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
 
-def download_newest_pdf(output_dir="ucsd_police_reports"):
-    base_url = "https://www.police.ucsd.edu/docs/reports/callsandarrests/Calls_and_Arrests.asp"
-    
-    os.makedirs(output_dir, exist_ok=True)
-    
+BASE_URL = "https://www.police.ucsd.edu/docs/reports/callsandarrests/Calls_and_Arrests.asp"
+
+def create_driver():
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
+    return webdriver.Chrome(options=chrome_options)
+
+def option_filename(text):
+    return text if text.endswith('.pdf') else f"{text}.pdf"
+
+def find_pdf_url(driver):
+    pdf_links = driver.find_elements(By.XPATH, "//a[contains(@href, '.pdf')]")
+    if pdf_links:
+        return pdf_links[0].get_attribute('href')
+    if driver.current_url.endswith('.pdf'):
+        return driver.current_url
+    return None
+
+def download_newest_pdf(output_dir="ucsd_police_reports"):
+    os.makedirs(output_dir, exist_ok=True)
     
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     
     try:
-        driver.get(base_url)
+        driver.get(BASE_URL)
         time.sleep(2)
         
         select = Select(driver.find_element(By.TAG_NAME, "select"))
@@ -32,7 +45,7 @@ def download_newest_pdf(output_dir="ucsd_police_reports"):
             if not text or "Select" in text:
                 continue
             
-            filename = text if text.endswith('.pdf') else f"{text}.pdf"
+            filename = option_filename(text)
             filepath = os.path.join(output_dir, filename)
             
             if os.path.exists(filepath):
@@ -43,13 +56,7 @@ def download_newest_pdf(output_dir="ucsd_police_reports"):
                 select.select_by_index(idx)
                 time.sleep(1)
                 
-                pdf_url = None
-                pdf_links = driver.find_elements(By.XPATH, "//a[contains(@href, '.pdf')]")
-                
-                if pdf_links:
-                    pdf_url = pdf_links[0].get_attribute('href')
-                elif driver.current_url.endswith('.pdf'):
-                    pdf_url = driver.current_url
+                pdf_url = find_pdf_url(driver)
                 
                 if pdf_url:
                     response = requests.get(pdf_url, timeout=30)
@@ -69,19 +76,12 @@ def download_newest_pdf(output_dir="ucsd_police_reports"):
         driver.quit()
 
 def download_ucsd_police_pdfs(output_dir="ucsd_police_reports"):
-    base_url = "https://www.police.ucsd.edu/docs/reports/callsandarrests/Calls_and_Arrests.asp"
-    
     os.makedirs(output_dir, exist_ok=True)
     
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     
     try:
-        driver.get(base_url)
+        driver.get(BASE_URL)
         time.sleep(2)
         
         select = Select(driver.find_element(By.TAG_NAME, "select"))
@@ -94,7 +94,7 @@ def download_ucsd_police_pdfs(output_dir="ucsd_police_reports"):
             if not text or "Select" in text:
                 continue
             
-            filename = text if text.endswith('.pdf') else f"{text}.pdf"
+            filename = option_filename(text)
             filepath = os.path.join(output_dir, filename)
             
             if os.path.exists(filepath):
@@ -106,13 +106,7 @@ def download_ucsd_police_pdfs(output_dir="ucsd_police_reports"):
                 select.select_by_index(idx)
                 time.sleep(1)
                 
-                pdf_url = None
-                pdf_links = driver.find_elements(By.XPATH, "//a[contains(@href, '.pdf')]")
-                
-                if pdf_links:
-                    pdf_url = pdf_links[0].get_attribute('href')
-                elif driver.current_url.endswith('.pdf'):
-                    pdf_url = driver.current_url
+                pdf_url = find_pdf_url(driver)
                 
                 if pdf_url:
                     response = requests.get(pdf_url, timeout=30)
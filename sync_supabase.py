@@ -3,10 +3,12 @@ import os
 import sys
 import json
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from collections import defaultdict
 from typing import List, Dict, Any, Optional
 
+from incident import Incident
+
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
@@ -133,7 +135,7 @@ def format_date(date_str: Optional[str]) -> str:
         # Return today's date as fallback
         return datetime.now().strftime('%m/%d/%Y')
 
-def transform_report_to_incident(report: Dict[str, Any]) -> Dict[str, Any]:
+def transform_report_to_incident(report: Dict[str, Any]) -> Incident:
     """Transform a Supabase report into a crime incident format"""
     # Get date_reported - use created_at if date_reported doesn't exist
     date_reported = report.get('date_reported')
@@ -142,25 +144,25 @@ def transform_report_to_incident(report: Dict[str, Any]) -> Dict[str, Any]:
         date_reported = report.get('created_at', datetime.now().strftime('%Y-%m-%d'))
         logger.info(f"Using created_at as date_reported for case {report.get('incident_case', 'unknown')}")
 
-    return {
-        'incident_case': report['incident_case'],
-        'category': report['category'],
-        'location': report['location'],
-        'date_occurred': format_date(report['date_occurred']),
-        'time_occurred': format_time(report.get('time_occurred')),
-        'date_reported': format_date(date_reported),
-        'summary': report['summary'],
-        'disposition': report.get('disposition', 'Under Review')
-    }
+    return Incident(
+        incident_case=report['incident_case'],
+        category=report['category'],
+        location=report['location'],
+        date_occurred=format_date(report['date_occurred']),
+        time_occurred=format_time(report.get('time_occurred')),
+        date_reported=format_date(date_reported),
+        summary=report['summary'],
+        disposition=report.get('disposition', 'Under Review')
+    )
 
-def group_reports_by_date(reports: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def group_reports_by_date(reports: List[Dict[str, Any]]) -> Dict[date, List[Incident]]:
 
     grouped = defaultdict(list)
 
     for report in reports:
-        date_occurred = report['date_occurred']
         incident = transform_report_to_incident(report)
-        grouped[date_occurred].append(incident)
+        # format_date always yields a valid MM/DD/YYYY, so occurred_on is never None here
+        grouped[incident.occurred_on].append(incident)
 
     logger.info(f"✓ Grouped reports into {len(grouped)} date(s)")
     return grouped
@@ -169,28 +171,26 @@ def format_report_filename(date_str: str) -> str:
 
     return f"user-submitted-{date_str}.pdf"
 
-def format_report_date(date_str: str) -> str:
+def format_report_date(date_obj: date) -> str:
 
-    try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        return date_obj.strftime('%B %d, %Y')
-    except ValueError as e:
-        logger.warning(f"⚠ Invalid date format: {date_str} - {e}")
-        return date_str
+    return date_obj.strftime('%B %d, %Y')
 
 def integrate_reports_into_json(
     police_reports: Dict[str, Any],
-    grouped_reports: Dict[str, List[Dict[str, Any]]]
+    grouped_reports: Dict[date, List[Incident]]
 ) -> int:
 
     added_count = 0
 
-    for date_occurred, incidents in grouped_reports.items():
+    for date_occurred, grouped in grouped_reports.items():
+
+        incidents = [incident.to_dict() for incident in grouped]
+        report_date = format_report_date(date_occurred)
 
         existing_report = None
         for report in police_reports['reports']:
 
-            if report.get('date') == format_report_date(date_occurred):
+            if report.get('date') == report_date:
                 existing_report = report
                 break
 
@@ -204,8 +204,8 @@ def integrate_reports_into_json(
 
             logger.info(f"  Creating new report for {date_occurred} with {len(incidents)} incident(s)")
             new_report = {
-                'filename': format_report_filename(date_occurred),
-                'date': format_report_date(date_occurred),
+                'filename': format_report_filename(date_occurred.isoformat()),
+                'date': report_date,
                 'page_count': 1,  
                 'incident_count': len(incidents),
                 'incidents': incidents